@@ -228,6 +228,78 @@ func determineProjectRoot(configPath string) (string, error) {
 	return wd, nil
 }
 
+func readManifest(path string) ([]config.ManifestEntry, error) {
+	if path == "-" {
+		return config.ReadManifest(os.Stdin)
+	}
+	f, err := os.Open(path)
+	if err != nil {
+		return nil, fmt.Errorf("failed to open manifest %s: %w", path, err)
+	}
+	defer f.Close()
+	return config.ReadManifest(f)
+}
+
+// runManifest executes every run listed in a manifest inside this process, so
+// that start-up and logger setup are paid once rather than once per report.
+//
+// Each entry is layered over the CLI flags (and the config file, if any) and
+// runs through the regular pipeline. A failing entry is logged and does not
+// stop the remaining ones. The returned exit code is non-zero if any entry
+// failed.
+func runManifest(manifestPath, configPath string, cliInput config.RawConfigInput, start time.Time) int {
+	entries, err := readManifest(manifestPath)
+	if err != nil {
+		slog.Error("Manifest error", "error", err)
+		return 1
+	}
+
+	projectRoot, err := determineProjectRoot(configPath)
+	if err != nil {
+		slog.Error("Failed to determine project root", "error", err)
+		return 1
+	}
+	slog.Info("Project root determined", "path", projectRoot)
+
+	loggerReady := false
+	failed := 0
+	for i, entry := range entries {
+		appConfig, err := config.Load(configPath, entry.Apply(cliInput))
+		if err != nil {
+			slog.Error("Configuration error in manifest entry", "entry", i, "error", err)
+			failed++
+			continue
+		}
+		appConfig.ProjectRoot = projectRoot
+
+		// Logging settings cannot be set per entry, so the logger is shared by all runs.
+		if !loggerReady {
+			closer, err := buildLogger(appConfig)
+			if err != nil {
+				fmt.Fprintln(os.Stderr, "logger init error:", err)
+				return 1
+			}
+			if closer != nil {
+				defer closer.Close()
+			}
+			loggerReady = true
+		}
+
+		slog.Info("Running manifest entry", "entry", i, "output", appConfig.OutputDir)
+		if err := executePipeline(appConfig); err != nil {
+			slog.Error("An error occurred during report generation", "entry", i, "error", err)
+			failed++
+		}
+	}
+
+	if failed > 0 {
+		slog.Error("Manifest finished with failures", "failed", failed, "total", len(entries))
+		return 1
+	}
+	slog.Info("Report generation completed successfully", "runs", len(entries), "duration", time.Since(start).Round(time.Millisecond))
+	return 0
+}
+
 func main() {
 	start := time.Now()
 	flag.Usage = func() {
@@ -237,6 +309,7 @@ func main() {
 
 	configPath := flag.String("config", "", "Path to a nanovision.yaml configuration file.")
 	watchFlag := flag.Bool("watch", false, "Enable watch mode to automatically regenerate reports on file changes")
+	manifestPath := flag.String("manifest", "", "Path to a JSON manifest of report runs to execute in one process ('-' reads stdin); cannot be combined with -watch")
 
 	rawInput := parseAndBindFlags()
 	flag.Parse()
@@ -245,6 +318,14 @@ func main() {
 		fmt.Fprintf(os.Stderr, "Warning: %v. Defaulting to 'Info' level.\n", err)
 	}
 
+	if *manifestPath != "" {
+		if *watchFlag {
+			fmt.Fprintln(os.Stderr, "Error: -manifest cannot be combined with -watch")
+			os.Exit(1)
+		}
+		os.Exit(runManifest(*manifestPath, *configPath, *rawInput, start))
+	}
+
 	appConfig, err := config.Load(*configPath, *rawInput)
 	if err != nil {
 		slog.Error("Configuration error", "error", err)
@@ -0,0 +1,57 @@
+package config
+
+import (
+	"encoding/json"
+	"errors"
+	"fmt"
+	"io"
+	"strings"
+)
+
+// ManifestEntry describes a single report run inside a manifest. Every field
+// that is set overrides the matching command line flag for that run only.
+type ManifestEntry struct {
+	Reports     []string `json:"reports"`
+	SourceDirs  []string `json:"source_dirs"`
+	ReportTypes []string `json:"report_types"`
+	OutputDir   string   `json:"output_dir"`
+	Title       string   `json:"title"`
+	Tag         string   `json:"tag"`
+}
+
+// ReadManifest decodes a JSON array of manifest entries.
+func ReadManifest(r io.Reader) ([]ManifestEntry, error) {
+	var entries []ManifestEntry
+	decoder := json.NewDecoder(r)
+	decoder.DisallowUnknownFields()
+	if err := decoder.Decode(&entries); err != nil {
+		return nil, fmt.Errorf("failed to parse manifest: %w", err)
+	}
+	if len(entries) == 0 {
+		return nil, errors.New("manifest contains no entries")
+	}
+	return entries, nil
+}
+
+// Apply returns a copy of the CLI input with the entry's values layered on top.
+func (e ManifestEntry) Apply(cli RawConfigInput) RawConfigInput {
+	if len(e.Reports) > 0 {
+		cli.ReportPatterns = strings.Join(e.Reports, ";")
+	}
+	if len(e.SourceDirs) > 0 {
+		cli.SourceDirs = strings.Join(e.SourceDirs, ";")
+	}
+	if len(e.ReportTypes) > 0 {
+		cli.ReportTypes = strings.Join(e.ReportTypes, ",")
+	}
+	if e.OutputDir != "" {
+		cli.OutputDir = e.OutputDir
+	}
+	if e.Title != "" {
+		cli.Title = e.Title
+	}
+	if e.Tag != "" {
+		cli.Tag = e.Tag
+	}
+	return cli
+}
@@ -0,0 +1,60 @@
+package config
+
+import (
+	"strings"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestReadManifest(t *testing.T) {
+	t.Run("ValidManifest_ReturnsEntries", func(t *testing.T) {
+		input := `[
+			{"reports": ["a.xml", "b.out"], "source_dirs": ["src/a", "src/b"], "output_dir": "out/merged"},
+			{"reports": ["a.xml"], "source_dirs": ["src/a"], "report_types": ["Html"], "title": "A only"}
+		]`
+
+		entries, err := ReadManifest(strings.NewReader(input))
+		require.NoError(t, err)
+		require.Len(t, entries, 2)
+		assert.Equal(t, []string{"a.xml", "b.out"}, entries[0].Reports)
+		assert.Equal(t, "out/merged", entries[0].OutputDir)
+		assert.Equal(t, []string{"Html"}, entries[1].ReportTypes)
+		assert.Equal(t, "A only", entries[1].Title)
+	})
+
+	t.Run("EmptyManifest_ReturnsError", func(t *testing.T) {
+		_, err := ReadManifest(strings.NewReader(`[]`))
+		assert.Error(t, err)
+	})
+
+	t.Run("UnknownField_ReturnsError", func(t *testing.T) {
+		_, err := ReadManifest(strings.NewReader(`[{"report": "a.xml"}]`))
+		assert.Error(t, err)
+	})
+}
+
+func TestManifestEntryApply(t *testing.T) {
+	cli := RawConfigInput{
+		ReportPatterns: "cli.xml",
+		SourceDirs:     "cli_src",
+		ReportTypes:    "Lcov",
+		OutputDir:      "cli_out",
+		Verbosity:      "Warning",
+	}
+
+	entry := ManifestEntry{
+		Reports:    []string{"a.xml", "b.out"},
+		SourceDirs: []string{"src/a", "src/b"},
+		OutputDir:  "out/merged",
+	}
+	merged := entry.Apply(cli)
+
+	assert.Equal(t, "a.xml;b.out", merged.ReportPatterns)
+	assert.Equal(t, "src/a;src/b", merged.SourceDirs)
+	assert.Equal(t, "out/merged", merged.OutputDir)
+	assert.Equal(t, "Lcov", merged.ReportTypes, "unset entry fields keep the CLI value")
+	assert.Equal(t, "Warning", merged.Verbosity)
+	assert.Equal(t, "cli.xml", cli.ReportPatterns, "the CLI input itself is not modified")
+}
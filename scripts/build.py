@@ -1,8 +1,11 @@
 import argparse
 import os
+import shlex
 import subprocess
 import sys
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # --- Configuration ---
 # The root of the script is the project root.
@@ -18,53 +21,103 @@ MAIN_PACKAGE_PATH = "cmd/main.go"
 BINARY_NAME_LINUX = "nanovision"
 BINARY_NAME_WINDOWS = "nanovision.exe"
 
+GO_EXECUTABLE = shutil.which("go") # None when Go is not installed
 
-def run_command(command, env=None, working_dir=SCRIPT_ROOT):
-    """Executes a command, streams output, and exits if it fails."""
-    print(f"--- Running Command: {' '.join(command)}")
+# Release builds drop the symbol table and DWARF data and strip local paths,
+# which makes the binaries smaller and quicker to load.
+RELEASE_BUILD_FLAGS = ["-trimpath", "-ldflags=-s -w"]
+
+
+def require_go():
+    """Returns the resolved path of the Go toolchain, exiting with a clear error if it is missing."""
+    if GO_EXECUTABLE is None:
+        print("--- Error: Go toolchain not found. Install Go and make sure 'go' is on your PATH.", file=sys.stderr)
+        sys.exit(1)
+    return GO_EXECUTABLE
+
+# Serialises console writes while several builds run at once.
+OUTPUT_LOCK = threading.Lock()
+
+def say(message, tag=None, file=sys.stdout):
+    """Prints a message, prefixed with `[tag]` if one is given."""
+    prefix = f"[{tag}] " if tag else ""
+    with OUTPUT_LOCK:
+        print(prefix + message, file=file, flush=True)
+
+def run_command(command, env=None, working_dir=SCRIPT_ROOT, tag=None):
+    """Executes a command, streams output, and exits if it fails.
+
+    With a `tag`, the command's output is relayed line by line with a
+    `[tag]` prefix, so builds running side by side stay readable.
+    """
+    say(f"--- Running Command: {shlex.join(command)}", tag)
     try:
-        process_env = os.environ.copy()
+        process_env = None # Inherit our environment unless there are overrides
         if env:
+            process_env = os.environ.copy()
             process_env.update(env)
-        subprocess.run(
-            command, check=True, env=process_env, cwd=working_dir,
-            stdout=sys.stdout, stderr=sys.stderr
-        )
-    except subprocess.CalledProcessError as e:
-        print(f"--- Command failed with exit code {e.returncode}", file=sys.stderr)
-        sys.exit(e.returncode)
+        if tag is None:
+            # Flush pending prints first; the child writes straight to our stdout.
+            sys.stdout.flush()
+            return_code = subprocess.run(
+                command, env=process_env, cwd=working_dir, stdout=sys.stdout, stderr=sys.stderr
+            ).returncode
+        else:
+            with subprocess.Popen(
+                command, env=process_env, cwd=working_dir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+            ) as process:
+                prefix = f"[{tag}] ".encode()
+                for line in process.stdout:
+                    with OUTPUT_LOCK:
+                        sys.stdout.buffer.write(prefix + line.rstrip(b"\r\n") + b"\n")
+                        sys.stdout.buffer.flush()
+            return_code = process.returncode
     except FileNotFoundError:
-        print(f"--- Error: Command not found: {command[0]}", file=sys.stderr)
+        say(f"--- Error: Command not found: {command[0]}", tag, sys.stderr)
         sys.exit(1)
+    if return_code != 0:
+        say(f"--- Command failed with exit code {return_code}", tag, sys.stderr)
+        sys.exit(return_code)
 
 def clean_directory(path):
     """Removes a directory and all its contents, then recreates it."""
+    if os.path.isdir(path) and not os.listdir(path):
+        print(f"--- Directory already clean: {path} ---")
+        return
     if os.path.exists(path):
         print(f"--- Cleaning directory: {path} ---")
         shutil.rmtree(path)
     print(f"--- Creating directory: {path} ---")
     os.makedirs(path)
 
-def build_linux():
+def go_build_command(output_path, debug=False):
+    """Returns the `go build` command line, with release flags unless `debug` is set."""
+    cmd = [require_go(), "build", "-mod=vendor"]
+    if not debug:
+        cmd.extend(RELEASE_BUILD_FLAGS)
+    cmd.extend(["-o", output_path, MAIN_PACKAGE_PATH])
+    return cmd
+
+def build_linux(debug=False, tag=None):
     """Builds the Go project for Linux."""
-    print("--- Building for Linux (amd64) ---")
+    say("--- Building for Linux (amd64) ---", tag)
     env = {"GOOS": "linux", "GOARCH": "amd64"}
     output_path = os.path.join(OUTPUT_DIR, BINARY_NAME_LINUX)
-    cmd = ["go", "build", "-mod=vendor", "-o", output_path, MAIN_PACKAGE_PATH]
-    run_command(cmd, env=env)
-    print(f"--- Linux build complete: {output_path} ---")
+    cmd = go_build_command(output_path, debug)
+    run_command(cmd, env=env, tag=tag)
+    say(f"--- Linux build complete: {output_path} ---", tag)
 
-def build_windows():
+def build_windows(debug=False, tag=None):
     """Builds the Go project for Windows, enabling CGo for cross-compilation."""
-    print("--- Building for Windows (amd64) ---")
+    say("--- Building for Windows (amd64) ---", tag)
     env = {
         "GOOS": "windows", "GOARCH": "amd64", "CGO_ENABLED": "1",
         "CC": "x86_64-w64-mingw32-gcc", "CXX": "x86_64-w64-mingw32-g++"
     }
     output_path = os.path.join(OUTPUT_DIR, BINARY_NAME_WINDOWS)
-    cmd = ["go", "build", "-mod=vendor", "-o", output_path, MAIN_PACKAGE_PATH]
-    run_command(cmd, env=env)
-    print(f"--- Windows build complete: {output_path} ---")
+    cmd = go_build_command(output_path, debug)
+    run_command(cmd, env=env, tag=tag)
+    say(f"--- Windows build complete: {output_path} ---", tag)
 
 def main():
     """Main function to parse arguments and execute the corresponding action."""
@@ -75,17 +128,30 @@ def main():
         choices=['all', 'linux', 'windows'],
         help="The target platform to build for: 'all' (default), 'linux', or 'windows'."
     )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Keep symbols, debug info and full source paths (skips '-trimpath' and '-ldflags=-s -w')."
+    )
     args = parser.parse_args()
 
     clean_directory(OUTPUT_DIR)
 
     if args.target == 'all':
-        build_linux()
-        build_windows()
+        # The two builds are independent toolchain runs writing different
+        # binaries, so let them overlap instead of waiting on each other.
+        # Their output is tagged with the target so it stays apart.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(build_linux, args.debug, "linux"),
+                executor.submit(build_windows, args.debug, "windows"),
+            ]
+            for future in as_completed(futures):
+                future.result()
     elif args.target == 'linux':
-        build_linux()
+        build_linux(args.debug)
     elif args.target == 'windows':
-        build_windows()
+        build_windows(args.debug)
 
     print("\n--- All builds completed successfully! ---")
     print(f"Final binaries are located in: {OUTPUT_DIR}")
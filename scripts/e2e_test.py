@@ -6,7 +6,8 @@ This script validates the compiled nanovision CLI tool by running it against a
 variety of demo projects and coverage report formats.
 
 Key Features:
-- Builds the tool automatically for the host OS.
+- Builds the tool automatically for the host OS, skipping the build when the
+  existing binary is newer than every source file ('--rebuild-binary' forces it).
 - Runs a predefined suite of test cases for C#, Go, and C++ projects.
 - Tests both individual and merged report generation scenarios.
 - Verifies command exit codes and the creation of expected output files.
@@ -14,13 +15,19 @@ Key Features:
 - Includes a '--self-cover' mode to generate a coverage report for the
   nanovision tool itself, combining unit and E2E test coverage.
 - Use the '-v' or '--verbose' flag to see the live output from the CLI tool.
+- Runs independent test cases in parallel; use '-j' or '--jobs' to limit it.
+- Use '--batch' to generate all passing-case reports in one '-manifest' run.
 """
 import argparse
+import json
 import os
+import shlex
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 
 # ==============================================================================
@@ -29,10 +36,19 @@ from dataclasses import dataclass, field
 
 # Core Project Paths
 SCRIPT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-SCRIPTS_DIR = os.path.join(SCRIPT_ROOT, "scripts")
 REPORTS_OUTPUT_DIR = os.path.join(SCRIPT_ROOT, "reports") # For E2E report outputs
 BINARY_DIR = os.path.join(SCRIPT_ROOT, "bin")
-BUILD_SCRIPT_PATH = os.path.join(SCRIPTS_DIR, "build.py")
+MAIN_PACKAGE_PATH = os.path.join(SCRIPT_ROOT, "cmd", "main.go")
+BUILD_MODE_STAMP = os.path.join(BINARY_DIR, ".build-mode") # Records whether the binary has coverage instrumentation
+
+# Top-level directories that never feed into the Go build, skipped when
+# checking whether the existing binary is out of date.
+NON_SOURCE_DIRS = {
+    os.path.join(SCRIPT_ROOT, name)
+    for name in ("bin", "reports", "docs", "demo_projects", "scripts", "ui")
+}
+
+GO_EXECUTABLE = shutil.which("go") # None when Go is not installed
 
 # Demo Project Paths
 DEMO_PROJECTS_ROOT = os.path.join(SCRIPT_ROOT, "demo_projects")
@@ -65,76 +81,73 @@ class TestCase:
     """Defines a single E2E test case."""
     name: str
     output_dir_name: str
-    args: list[str]
+    # Report paths/patterns and their matching source directories, paired by index
+    reports: list[str] = field(default_factory=list)
+    source_dirs: list[str] = field(default_factory=list)
     expect_success: bool = True
     # List of files expected in the output dir (relative paths)
     output_files: list[str] = field(default_factory=lambda: ["index.html"])
 
+    def cli_args(self):
+        """Returns the '-report' and '-sourcedirs' arguments for this case."""
+        args = []
+        if self.reports:
+            args.append("-report=" + ";".join(self.reports))
+        if self.source_dirs:
+            args.append("-sourcedirs=" + ";".join(self.source_dirs))
+        return args
+
 # --- Primary E2E Test Cases ---
 DEMO_PROJECT_TESTS = [
     # Individual Reports
     TestCase(
         name="C# Project Only (from Cobertura)",
         output_dir_name="csharp_cobertura_only",
-        args=[
-            f"-report={CSHARP_COBERTURA_XML}",
-            f"-sourcedirs={CSHARP_PROJECT_DIR}",
-        ],
+        reports=[CSHARP_COBERTURA_XML],
+        source_dirs=[CSHARP_PROJECT_DIR],
     ),
     TestCase(
         name="Go Project Only (from gocover)",
         output_dir_name="go_gocover_only",
-        args=[
-            f"-report={GO_COVERAGE_OUT}",
-            f"-sourcedirs={GO_PROJECT_DIR}",
-        ],
+        reports=[GO_COVERAGE_OUT],
+        source_dirs=[GO_PROJECT_DIR],
     ),
     TestCase(
         name="C++ Project Only (from gcov)",
         output_dir_name="cpp_gcov_only",
-        args=[
-            f"-report={CPP_GCOV_PATTERN}",
-            f"-sourcedirs={CPP_PROJECT_DIR}",
-        ],
+        reports=[CPP_GCOV_PATTERN],
+        source_dirs=[CPP_PROJECT_DIR],
     ),
     TestCase(
         name="C++ Project Only (from Cobertura)",
         output_dir_name="cpp_cobertura_only",
-        args=[
-            f"-report={CPP_COBERTURA_XML}",
-            f"-sourcedirs={CPP_PROJECT_DIR}",
-        ],
+        reports=[CPP_COBERTURA_XML],
+        source_dirs=[CPP_PROJECT_DIR],
     ),
     # Merged Reports
     TestCase(
         name="Merged - All Cobertura Reports",
         output_dir_name="merged_all_cobertura",
-        args=[
-            f"-report={CSHARP_COBERTURA_XML};{CPP_COBERTURA_XML}",
-            f"-sourcedirs={CSHARP_PROJECT_DIR};{CPP_PROJECT_DIR}",
-        ],
+        reports=[CSHARP_COBERTURA_XML, CPP_COBERTURA_XML],
+        source_dirs=[CSHARP_PROJECT_DIR, CPP_PROJECT_DIR],
     ),
     TestCase(
         name="Merged - All C++ Reports",
         output_dir_name="merged_all_cpp",
-        args=[
-            f"-report={CPP_GCOV_PATTERN};{CPP_COBERTURA_XML}",
-            f"-sourcedirs={CPP_PROJECT_DIR};{CPP_PROJECT_DIR}",
-        ],
+        reports=[CPP_GCOV_PATTERN, CPP_COBERTURA_XML],
+        source_dirs=[CPP_PROJECT_DIR, CPP_PROJECT_DIR],
     ),
     TestCase(
         name="Merged - All Projects (Mixed Input Types)",
         output_dir_name="merged_all_projects_mixed",
-        args=[
-            f"-report={CSHARP_COBERTURA_XML};{GO_COVERAGE_OUT};{CPP_GCOV_PATTERN}",
-            f"-sourcedirs={CSHARP_PROJECT_DIR};{GO_PROJECT_DIR};{CPP_PROJECT_DIR}",
-        ],
+        reports=[CSHARP_COBERTURA_XML, GO_COVERAGE_OUT, CPP_GCOV_PATTERN],
+        source_dirs=[CSHARP_PROJECT_DIR, GO_PROJECT_DIR, CPP_PROJECT_DIR],
     ),
     # Failure Case
     TestCase(
         name="Failure - Missing Report Argument",
         output_dir_name="failure_missing_report_arg",
-        args=["-sourcedirs=."],
+        source_dirs=["."],
         expect_success=False,
         output_files=[] # No output expected on failure
     )
@@ -145,7 +158,7 @@ SELF_COVERAGE_TESTS = [
     TestCase(
         name="nanovision Self-Coverage (Unit + Integration Merged)",
         output_dir_name="nanovision_self_coverage_full",
-        args=[], # No args, its using config file
+        # No reports or source dirs, its using config file
     )
 ]
 
@@ -154,27 +167,112 @@ SELF_COVERAGE_TESTS = [
 #  Helper Functions
 # ==============================================================================
 
-def run_command(command, working_dir=SCRIPT_ROOT, suppress_output=True, critical=False):
-    """Executes a command, returns its exit code, and optionally exits on failure."""
-    print(f"--- Running Command: {' '.join(command)}")
-    stdout = subprocess.DEVNULL if suppress_output else sys.stdout
-    stderr = subprocess.DEVNULL if suppress_output else sys.stderr
+def require_go():
+    """Returns the resolved path of the Go toolchain, exiting with a clear error if it is missing."""
+    if GO_EXECUTABLE is None:
+        print("--- Error: Go toolchain not found. Install Go and make sure 'go' is on your PATH.", file=sys.stderr)
+        sys.exit(1)
+    return GO_EXECUTABLE
+
+def emit(message, log=None, file=sys.stdout):
+    """Prints a message, or appends it to `log` when output is being buffered."""
+    if log is None:
+        print(message, file=file)
+    else:
+        log.append(message)
+
+# Serialises console writes between the main thread and the output relay threads.
+STDOUT_LOCK = threading.Lock()
+
+def flush_log(log):
+    """Prints a buffered log as one uninterrupted block."""
+    with STDOUT_LOCK:
+        for entry in log:
+            print(entry, flush=True)
+
+def relay_output(stream, prefix):
+    """Copies a child's output to our stdout line by line, adding `prefix` to each line.
+
+    If our stdout goes away (e.g. piped into 'head'), the rest of the output
+    is still read and discarded so the child never blocks on a full pipe.
+    """
+    console_open = True
+    for line in iter(stream.readline, b""):
+        if not console_open:
+            continue
+        if not line.endswith(b"\n"):
+            line += b"\n"
+        try:
+            with STDOUT_LOCK:
+                # Raw bytes straight to the stdout buffer; the output is never decoded.
+                sys.stdout.buffer.write(prefix + line)
+                sys.stdout.buffer.flush()
+        except (OSError, ValueError):
+            console_open = False
+
+def stream_tagged(command, working_dir, tag):
+    """Runs a command while a background thread relays its output live, tagged with `[tag]`.
+
+    Draining on its own thread means the child never blocks on a full pipe,
+    and the per-line tag keeps concurrent runs apart on the console. The
+    command banner is printed, with the same tag, before the process starts.
+    """
+    prefix = f"[{tag}] "
+    with STDOUT_LOCK:
+        print(f"{prefix}--- Running Command: {shlex.join(command)}", flush=True)
+    process = subprocess.Popen(command, cwd=working_dir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    relay = threading.Thread(target=relay_output, args=(process.stdout, prefix.encode()), daemon=True)
+    relay.start()
+    return_code = process.wait()
+    relay.join()
+    process.stdout.close()
+    return return_code
+
+def run_command(command, working_dir=SCRIPT_ROOT, suppress_output=True, critical=False, log=None, stdin_data=None,
+                tag=None):
+    """Executes a command, returns its exit code, and optionally exits on failure.
+
+    If a `log` list is given, messages are collected into it instead of being
+    written straight to the console. With a `tag`, unsuppressed command output
+    is relayed live, each line prefixed with `[tag]` (see stream_tagged).
+    `stdin_data` (bytes), if given, is fed to the command's standard input;
+    it cannot be combined with a `tag`.
+    """
+    if stdin_data is not None and tag is not None:
+        raise ValueError("stdin_data cannot be combined with a tag")
+    relay = not suppress_output and tag is not None
+    if not relay:
+        emit(f"--- Running Command: {shlex.join(command)}", log)
+    if suppress_output:
+        # Suppressed output is never read, so don't pay to collect it. The one
+        # exception is stderr of a critical command, kept so an abort can say why.
+        stdout = subprocess.DEVNULL
+        stderr = subprocess.PIPE if critical else subprocess.DEVNULL
+    elif not relay:
+        stdout, stderr = sys.stdout, sys.stderr
+        sys.stdout.flush() # The child writes straight to our stdout
     try:
-        process = subprocess.run(
-            command, cwd=working_dir, check=False, stdout=stdout, stderr=stderr
-        )
-        if critical and process.returncode != 0:
-            print(f"--- CRITICAL COMMAND FAILED (Code: {process.returncode}). Aborting. ---", file=sys.stderr)
+        if relay:
+            return_code, captured_stderr = stream_tagged(command, working_dir, tag), None
+        else:
+            process = subprocess.run(
+                command, cwd=working_dir, check=False, stdout=stdout, stderr=stderr, input=stdin_data
+            )
+            return_code, captured_stderr = process.returncode, process.stderr
+        if critical and return_code != 0:
+            if captured_stderr:
+                emit(captured_stderr.decode(errors="replace").rstrip("\n"), log, sys.stderr)
+            emit(f"--- CRITICAL COMMAND FAILED (Code: {return_code}). Aborting. ---", log, sys.stderr)
             sys.exit(1)
-        return process.returncode
+        return return_code
     except FileNotFoundError:
-        print(f"--- Error: Command not found: {command[0]}", file=sys.stderr)
+        emit(f"--- Error: Command not found: {command[0]}", log, sys.stderr)
         if critical: sys.exit(1)
         return -1
 
 def clean_directory(path):
     """Removes a directory and its contents, then recreates it."""
-    if os.path.exists(path):
+    if directory_has_entries(path): # An empty or missing directory needs no rmtree
         shutil.rmtree(path)
     os.makedirs(path, exist_ok=True)
 
@@ -188,6 +286,61 @@ def get_platform_and_binary_name():
         print(f"--- Unsupported platform: {sys.platform}", file=sys.stderr)
         sys.exit(1)
 
+def file_has_content(path):
+    """Checks that a file exists and is not empty with a single stat call."""
+    try:
+        return os.stat(path).st_size > 0
+    except FileNotFoundError:
+        return False
+
+def directory_has_entries(path):
+    """Checks that a directory exists and contains at least one entry."""
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except FileNotFoundError:
+        return False
+
+def input_available(path):
+    """Checks that a literal report input has content.
+
+    Patterns are left to the tool: its glob syntax ('**', '{}', ...) goes
+    beyond Python's, so judging them here could fail a case the tool handles.
+    """
+    if any(char in path for char in "*?[]{}"):
+        return True
+    return file_has_content(path)
+
+def sources_newer_than(timestamp, root=SCRIPT_ROOT):
+    """Returns True as soon as any file that feeds the Go build is newer than `timestamp`."""
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith(".") and entry.path not in NON_SOURCE_DIRS:
+                        pending.append(entry.path)
+                else:
+                    try:
+                        modified_at = entry.stat().st_mtime
+                    except FileNotFoundError:
+                        continue # A dangling symlink, such as an editor lock file
+                    if modified_at > timestamp:
+                        return True
+    return False
+
+def binary_is_fresh(binary_path, cover=False):
+    """Checks if the existing binary was built in the same mode and after the last source change."""
+    try:
+        built_at = os.stat(binary_path).st_mtime
+        with open(BUILD_MODE_STAMP) as f:
+            build_mode = f.read().strip()
+    except FileNotFoundError:
+        return False
+    if build_mode != ("cover" if cover else "plain"):
+        return False
+    return not sources_newer_than(built_at)
+
 def print_summary_report(results):
     """Prints a formatted summary of all attempted tasks."""
     print("\n" + "="*80)
@@ -217,41 +370,57 @@ def print_summary_report(results):
 #  Core E2E and Self-Coverage Functions
 # ==============================================================================
 
-def build_tool(platform, cover=False):
+def build_tool(platform, binary_path, cover=False):
     """Builds the Go application, optionally with coverage instrumentation."""
     action = "Building binary with coverage" if cover else "Building binary"
     print(f"\n--- {action} for {platform} ---")
-    binary_path = os.path.join(BINARY_DIR, get_platform_and_binary_name()[1])
-    build_cmd = ["go", "build", "-mod=vendor"]
+    build_cmd = [require_go(), "build", "-mod=vendor"]
     if cover:
         build_cmd.append("-cover")
-    build_cmd.extend(["-o", binary_path, os.path.join(SCRIPT_ROOT, "cmd/main.go")])
+    build_cmd.extend(["-o", binary_path, MAIN_PACKAGE_PATH])
     run_command(build_cmd, critical=True, suppress_output=False)
+    with open(BUILD_MODE_STAMP, "w") as f:
+        f.write("cover" if cover else "plain")
     print("--- Build successful ---")
 
 
-def run_test_suite(test_cases, binary_path, global_args, title_prefix="E2E", verbose=False):
-    """Runs a suite of test cases and returns a list of detailed result dicts."""
-    results = []
-    for case in test_cases:
-        print(f"\n--- Running {title_prefix} Test Case: {case.name} ---")
-
-        case_output_dir = os.path.join(REPORTS_OUTPUT_DIR, case.output_dir_name)
-        os.makedirs(case_output_dir, exist_ok=True)
+def outputs_present(case, case_output_dir):
+    """Checks that every output file the case expects was written and is not empty."""
+    return all(
+        file_has_content(os.path.join(case_output_dir, file_path))
+        for file_path in case.output_files
+    )
 
-        command = [binary_path] + case.args + global_args + [f"-output={case_output_dir}"]
-        return_code = run_command(command, suppress_output=not verbose)
 
-        actual_success = (return_code == 0)
-        test_passed = (actual_success == case.expect_success)
+def run_batch(test_cases, binary_path, global_args, title_prefix="E2E", verbose=False):
+    """Runs cases expected to succeed through one '-manifest' invocation of the tool.
+
+    The tool's start-up cost is paid once for the whole batch. A failing entry
+    does not stop the others, but the exit code only says whether any entry
+    failed, and a failed entry can still leave some of its outputs behind. So
+    a non-zero exit fails every case in the batch; otherwise each case is
+    judged by its own expected output files.
+    """
+    print(f"\n--- Running {len(test_cases)} {title_prefix} Test Cases in one batch ---")
+    output_dirs = [os.path.join(REPORTS_OUTPUT_DIR, case.output_dir_name) for case in test_cases]
+    manifest = []
+    for case, case_output_dir in zip(test_cases, output_dirs):
+        print(f"---   {case.name}")
+        os.makedirs(case_output_dir, exist_ok=True)
+        manifest.append({"reports": case.reports, "source_dirs": case.source_dirs, "output_dir": case_output_dir})
 
-        if test_passed and case.expect_success:
-            for file_path in case.output_files:
-                if not os.path.exists(os.path.join(case_output_dir, file_path)):
-                    test_passed = False
-                    break
+    command = [binary_path, "-manifest=-"] + global_args
+    return_code = run_command(command, suppress_output=not verbose, stdin_data=json.dumps(manifest).encode())
 
-        if test_passed:
+    results = []
+    for case, case_output_dir in zip(test_cases, output_dirs):
+        if return_code != 0:
+            results.append({
+                "name": case.name,
+                "status": "❌ FAILED",
+                "details": f"Batch run failed (exit code: {return_code}); rerun without '--batch' to find the failing case"
+            })
+        elif outputs_present(case, case_output_dir):
             results.append({
                 "name": case.name,
                 "status": "✅ SUCCESS",
@@ -261,13 +430,158 @@ def run_test_suite(test_cases, binary_path, global_args, title_prefix="E2E", ver
             results.append({
                 "name": case.name,
                 "status": "❌ FAILED",
-                "details": f"Expected success: {case.expect_success}, but got exit code: {return_code}"
+                "details": "Expected output files missing after batch run"
             })
+    return results
+
+
+def run_commands_concurrently(commands, suppress_output=True, log=None, tags=None):
+    """Runs independent commands in parallel and returns their exit codes in order.
+
+    Each command buffers its messages; the buffers are appended to `log` (or
+    printed) in command order once every command has finished. Unsuppressed
+    command output is relayed live, tagged with the matching entry of `tags`.
+    """
+    logs = [[] for _ in commands]
+    tags = tags or [str(index) for index in range(len(commands))]
+    with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+        return_codes = list(executor.map(
+            lambda command, command_log, tag: run_command(
+                command, suppress_output=suppress_output, log=command_log, tag=tag
+            ),
+            commands, logs, tags
+        ))
+    for command_log in logs:
+        if log is None:
+            flush_log(command_log)
+        else:
+            log.extend(command_log)
+    return return_codes
+
+
+def run_test_case(case, binary_path, global_args, title_prefix="E2E", verbose=False, log=None, missing_inputs=(),
+                  split_report_types=None):
+    """Runs a single test case and returns its detailed result dict.
+
+    A case expected to succeed whose input reports are listed in
+    `missing_inputs` fails straight away, without spawning the tool.
+
+    If `split_report_types` lists more than one type, the tool is started once
+    per type, all in parallel and writing to the same output directory, and
+    the case counts as successful only if every run succeeds.
+    """
+    emit(f"\n--- Running {title_prefix} Test Case: {case.name} ---", log)
+
+    if missing_inputs and case.expect_success:
+        emit(f"--- Missing input reports: {', '.join(missing_inputs)}", log, sys.stderr)
+        return {
+            "name": case.name,
+            "status": "❌ FAILED",
+            "details": f"Missing or empty input reports: {', '.join(missing_inputs)}"
+        }
+
+    case_output_dir = os.path.join(REPORTS_OUTPUT_DIR, case.output_dir_name)
+    os.makedirs(case_output_dir, exist_ok=True)
+
+    if split_report_types and len(split_report_types) > 1:
+        base_args = [arg for arg in global_args if not arg.startswith("-reporttypes=")]
+        commands = [
+            [binary_path, *case.cli_args(), *base_args, "-reporttypes=" + report_type, "-output=" + case_output_dir]
+            for report_type in split_report_types
+        ]
+        tags = [f"{case.output_dir_name}:{report_type}" for report_type in split_report_types]
+        return_codes = run_commands_concurrently(commands, suppress_output=not verbose, log=log, tags=tags)
+        return_code = next((code for code in return_codes if code != 0), 0)
+    else:
+        command = [binary_path, *case.cli_args(), *global_args, "-output=" + case_output_dir]
+        tag = case.output_dir_name if log is not None else None
+        return_code = run_command(command, suppress_output=not verbose, log=log, tag=tag)
+
+    actual_success = (return_code == 0)
+    test_passed = (actual_success == case.expect_success)
+
+    if test_passed and case.expect_success:
+        test_passed = outputs_present(case, case_output_dir)
+
+    if test_passed:
+        return {
+            "name": case.name,
+            "status": "✅ SUCCESS",
+            "details": f"Reports saved to '{case_output_dir}'"
+        }
+    return {
+        "name": case.name,
+        "status": "❌ FAILED",
+        "details": f"Expected success: {case.expect_success}, but got exit code: {return_code}"
+    }
+
+
+def run_test_suite(test_cases, binary_path, global_args, title_prefix="E2E", verbose=False, jobs=1, batch=False,
+                   split_report_types=None):
+    """Runs a suite of test cases and returns a list of detailed result dicts.
+
+    With more than one job the cases run concurrently. Each case buffers its
+    messages, which are printed as a single block once the case finishes, and
+    in verbose mode the tool output is relayed live with every line tagged by
+    the case's output directory name, so concurrent runs stay readable.
+
+    Input reports are checked once up front; many cases share the same
+    inputs, so each path is only stat'ed a single time per suite.
+
+    With `batch`, every case that is expected to succeed and has its inputs
+    runs through a single tool invocation (see run_batch); the remaining
+    cases run as usual. `split_report_types` is passed on to run_test_case
+    and does not apply to batched cases.
+    """
+    available = {}
+    for case in test_cases:
+        for path in case.reports:
+            if path not in available:
+                available[path] = input_available(path)
+
+    def missing_inputs(case):
+        return [path for path in case.reports if not available[path]]
+
+    results = [None] * len(test_cases)
+    pending = list(range(len(test_cases)))
+
+    if batch:
+        batched = [i for i in pending if test_cases[i].expect_success and not missing_inputs(test_cases[i])]
+        if len(batched) > 1:
+            batch_results = run_batch([test_cases[i] for i in batched], binary_path, global_args, title_prefix, verbose)
+            for index, result in zip(batched, batch_results):
+                results[index] = result
+            pending = [i for i in pending if i not in batched]
+
+    if jobs <= 1 or len(pending) <= 1:
+        for index in pending:
+            case = test_cases[index]
+            results[index] = run_test_case(
+                case, binary_path, global_args, title_prefix, verbose,
+                missing_inputs=missing_inputs(case), split_report_types=split_report_types
+            )
+        return results
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {}
+        for index in pending:
+            case = test_cases[index]
+            log = []
+            future = executor.submit(
+                run_test_case, case, binary_path, global_args, title_prefix, verbose, log, missing_inputs(case),
+                split_report_types
+            )
+            futures[future] = (index, log)
+
+        for future in as_completed(futures):
+            index, log = futures[future]
+            flush_log(log)
+            results[index] = future.result()
 
     return results
 
 
-def run_self_coverage_workflow(binary_path, global_args, verbose=False):
+def run_self_coverage_workflow(binary_path, global_args, verbose=False, go_test_parallel=None):
     """Handles the entire self-coverage report generation process."""
     print("\n" + "="*80)
     print("--- Starting nanovision Self-Coverage Workflow ---")
@@ -277,18 +591,21 @@ def run_self_coverage_workflow(binary_path, global_args, verbose=False):
 
     # 1. Run unit tests to generate the first coverage file.
     print("\n--- Step 1: Running unit tests for coverage ---")
-    unit_test_cmd = ["go", "test", "-v", f"-coverprofile={UNIT_TEST_COVERAGE_OUT}", "./..."]
+    unit_test_cmd = [require_go(), "test", "-v", f"-coverprofile={UNIT_TEST_COVERAGE_OUT}"]
+    if go_test_parallel:
+        unit_test_cmd.extend(["-p", str(go_test_parallel), "-parallel", str(go_test_parallel)])
+    unit_test_cmd.append("./...")
     run_command(unit_test_cmd, critical=True, suppress_output=not verbose)
     print(f"--- Unit test coverage saved to {UNIT_TEST_COVERAGE_OUT} ---")
 
     # 2. Process the raw integration coverage data.
     print("\n--- Step 2: Processing integration test coverage data ---")
     raw_cover_dir = os.environ.get("GOCOVERDIR")
-    if not raw_cover_dir or not os.path.exists(raw_cover_dir):
+    if not raw_cover_dir or not directory_has_entries(raw_cover_dir):
         print("--- WARNING: GOCOVERDIR is not set or empty. ---", file=sys.stderr)
         return [{"name": "Self-Coverage Data Processing", "status": "❌ FAILED", "details": "GOCOVERDIR was not found or empty."}]
 
-    convert_cmd = ["go", "tool", "covdata", "textfmt", f"-i={raw_cover_dir}", f"-o={INTEGRATION_TEST_COVERAGE_OUT}"]
+    convert_cmd = [require_go(), "tool", "covdata", "textfmt", f"-i={raw_cover_dir}", f"-o={INTEGRATION_TEST_COVERAGE_OUT}"]
     run_command(convert_cmd, critical=True, suppress_output=not verbose)
     print(f"--- Integration coverage saved to {INTEGRATION_TEST_COVERAGE_OUT} ---")
 
@@ -303,6 +620,11 @@ def main():
     parser.add_argument("-v", "--verbose", action="store_true", help="Stream the live output from the nanovision tool during tests.")
     parser.add_argument("-sc", "--self-cover", action="store_true", help="Build with coverage and generate a coverage report for the tool itself.")
     parser.add_argument("--report-types", default="Html,TextSummary,Lcov,RawJson", help="Comma-separated list of report types to generate.")
+    parser.add_argument("--rebuild-binary", action="store_true", help="Always rebuild the binary, even if it is newer than every source file.")
+    parser.add_argument("--go-test-parallel", type=int, default=None, help="Value for 'go test -p' and '-parallel' in the self-coverage unit test step (default: Go's own, GOMAXPROCS).")
+    parser.add_argument("--split-report-types", action="store_true", help="Run the tool once per report type, in parallel, for each test case.")
+    parser.add_argument("--batch", action="store_true", help="Run all cases expected to succeed through a single '-manifest' invocation of the tool.")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="Number of test cases to run in parallel (default: number of CPUs).")
     args = parser.parse_args()
 
     platform, binary_name = get_platform_and_binary_name()
@@ -319,13 +641,20 @@ def main():
 
         print("--- Setting up E2E test environment ---")
         clean_directory(REPORTS_OUTPUT_DIR)
-        clean_directory(BINARY_DIR)
-        build_tool(platform, cover=args.self_cover)
+        if args.rebuild_binary or not binary_is_fresh(binary_path, cover=args.self_cover):
+            clean_directory(BINARY_DIR)
+            build_tool(platform, binary_path, cover=args.self_cover)
+        else:
+            print(f"--- Binary is up to date, skipping build: {binary_path} ---")
 
         print("\n" + "="*80)
         print("--- Running Primary E2E Tests ---")
         print("="*80)
-        e2e_results = run_test_suite(DEMO_PROJECT_TESTS, binary_path, global_cli_args, verbose=args.verbose)
+        split_report_types = args.report_types.split(",") if args.split_report_types else None
+        e2e_results = run_test_suite(
+            DEMO_PROJECT_TESTS, binary_path, global_cli_args, verbose=args.verbose,
+            jobs=args.jobs, batch=args.batch, split_report_types=split_report_types
+        )
         all_results.extend(e2e_results)
 
         primary_tests_failed = any("FAILED" in r["status"] for r in e2e_results)
@@ -335,7 +664,9 @@ def main():
                 print("\n--- SKIPPING self-coverage workflow because primary E2E tests failed. ---", file=sys.stderr)
                 all_results.append({"name": "Self-Coverage Workflow", "status": "⚪ SKIPPED", "details": "Skipped due to failures in primary E2E tests."})
             else:
-                self_cover_results = run_self_coverage_workflow(binary_path, global_cli_args, verbose=args.verbose)
+                self_cover_results = run_self_coverage_workflow(
+                    binary_path, global_cli_args, verbose=args.verbose, go_test_parallel=args.go_test_parallel
+                )
                 all_results.extend(self_cover_results)
 
     finally:
@@ -1,4 +1,7 @@
+import argparse
 import os
+import shlex
+import shutil
 import subprocess
 import sys
 
@@ -9,13 +12,25 @@ SCRIPT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 # Coverage reports will be saved here.
 REPORTS_DIR = os.path.join(SCRIPT_ROOT, "reports")
 
+GO_EXECUTABLE = shutil.which("go") # None when Go is not installed
+
+def require_go():
+    """Returns the resolved path of the Go toolchain, exiting with a clear error if it is missing."""
+    if GO_EXECUTABLE is None:
+        print("--- Error: Go toolchain not found. Install Go and make sure 'go' is on your PATH.", file=sys.stderr)
+        sys.exit(1)
+    return GO_EXECUTABLE
+
 def run_command(command, env=None, working_dir=SCRIPT_ROOT):
     """Executes a command, streams output, and exits if it fails."""
-    print(f"--- Running Command: {' '.join(command)}")
+    print(f"--- Running Command: {shlex.join(command)}")
     try:
-        process_env = os.environ.copy()
+        process_env = None # Inherit our environment unless there are overrides
         if env:
+            process_env = os.environ.copy()
             process_env.update(env)
+        # Flush pending prints first; the child writes straight to our stdout.
+        sys.stdout.flush()
         subprocess.run(
             command, check=True, env=process_env, cwd=working_dir,
             stdout=sys.stdout, stderr=sys.stderr
@@ -27,7 +42,7 @@ def run_command(command, env=None, working_dir=SCRIPT_ROOT):
         print(f"--- Error: Command not found: {command[0]}", file=sys.stderr)
         sys.exit(1)
 
-def run_tests_with_coverage():
+def run_tests_with_coverage(parallel=None):
     """Runs Go unit tests and generates a coverage profile in the reports directory."""
     print("--- Running Unit Tests with Coverage ---")
     os.makedirs(REPORTS_DIR, exist_ok=True)
@@ -35,13 +50,25 @@ def run_tests_with_coverage():
     coverage_file = os.path.join(REPORTS_DIR, "coverage.out")
     print(f"Coverage profile will be saved to: {coverage_file}")
     
-    cmd = ["go", "test", "-v", f"-coverprofile={coverage_file}", "./..."]
+    cmd = [require_go(), "test", "-v", f"-coverprofile={coverage_file}"]
+    if parallel:
+        cmd.extend(["-p", str(parallel), "-parallel", str(parallel)])
+    cmd.append("./...")
     run_command(cmd)
     print("--- Unit Tests Passed ---")
 
 def main():
     """Main function to run the tests."""
-    run_tests_with_coverage()
+    parser = argparse.ArgumentParser(description="Unit test runner for the nanovision project.")
+    parser.add_argument(
+        "--go-test-parallel",
+        type=int,
+        default=None,
+        help="Packages built and tested in parallel ('go test -p') and parallel tests per package ('-parallel'). Go's own default (GOMAXPROCS) applies when unset."
+    )
+    args = parser.parse_args()
+
+    run_tests_with_coverage(parallel=args.go_test_parallel)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file